@@ -1,4 +1,5 @@
 import math
+import sys
 from typing import Callable
 
 
@@ -64,10 +65,240 @@ class Function:
         return "function: (" + self.string + ")"
 
 
+class Polynomial(Function):
+    coefficients: list[float] = None    # from the highest power to the free term
+
+    def __init__(self, s, coefficients: list[float]):
+        assert len(coefficients) > 0, "Not enough coefficients"
+        super().__init__(s, lambda x: Polynomial._horner(self.coefficients, x))
+        self.coefficients = [float(c) for c in coefficients]
+        # the leading coefficient must be nonzero for the companion matrix and the Sturm sequence
+        while len(self.coefficients) > 1 and self.coefficients[0] == 0:
+            self.coefficients.pop(0)
+        self._derivative = None
+
+    def derivative(self) -> "Polynomial":
+        if self._derivative is None:
+            power = len(self.coefficients) - 1
+            derived = [c * (power - i) for i, c in enumerate(self.coefficients[:-1])]
+            self._derivative = Polynomial("(" + self.string + ")'", derived if len(derived) > 0 else [0.0])
+        return self._derivative
+
+    def derivative_at(self, x: float, precision: float = 1e-5) -> float:
+        return self.derivative().at(x)
+
+    def double_derivative_at(self, x: float, precision: float = 1e-5) -> float:
+        return self.derivative().derivative().at(x)
+
+    def roots_on_interval(self, left: float, right: float, precision: float = 1e-12,
+                          max_polish_iterations: int = 50) -> list[float]:
+        import numpy as np
+
+        assert right > left, "Wrong interval"
+        derivative = self.derivative()
+        # np.roots computes eigenvalues of the companion matrix
+        candidates = np.roots(self.coefficients)
+        roots: list[float] = []
+        for candidate in candidates:
+            if abs(candidate.imag) > 1e-6 * max(1.0, abs(candidate)):
+                continue
+            x = float(candidate.real)
+            for _ in range(max_polish_iterations):
+                derivative_at_x = derivative.at(x)
+                if derivative_at_x == 0:
+                    break
+                step = self.at(x) / derivative_at_x
+                x -= step
+                if abs(step) < precision * max(1.0, abs(x)):
+                    break
+            if left <= x <= right and all(abs(x - root) > precision * max(1.0, abs(x)) for root in roots):
+                roots.append(x)
+        roots.sort()
+        # newton converges only to about sqrt(eps) near a multiple root, so it may leave several copies of it
+        merged: list[float] = []
+        for x in roots:
+            if len(merged) > 0 and self._is_same_multiple_root(merged[-1], x):
+                merged[-1] = min(merged[-1], x, key=lambda root: abs(self.at(root)))
+            else:
+                merged.append(x)
+        return merged
+
+    def has_one_root_on_interval(self, left: float, right: float, number_of_intervals_to_split: int = 1000) -> bool:
+        assert right > left, "Wrong interval"
+        if self.is_zero():
+            return False
+        if self.at(left) * self.at(right) > 0:
+            return False
+        return self.count_roots_on_interval(left, right) == 1
+
+    def is_zero(self) -> bool:
+        return all(c == 0 for c in self.coefficients)
+
+    def count_roots_on_interval(self, left: float, right: float) -> int:
+        # Sturm's theorem: distinct real roots in [left, right] without computing them.
+        # Remainders below 1e-12 of the dividend are treated as zero, so roots closer than
+        # that tolerance allows to resolve are counted as one multiple root
+        assert not self.is_zero(), "Zero polynomial has infinitely many roots"
+        sequence = [self.coefficients, self.derivative().coefficients]
+        while len(sequence[-1]) > 1:
+            remainder = Polynomial._remainder(sequence[-2], sequence[-1])
+            if len(remainder) == 0:
+                break
+            sequence.append([-c for c in remainder])
+        at_left = 1 if self.at(left) == 0 else 0    # the theorem counts on (left, right]
+        return Polynomial._sign_changes(sequence, left) - Polynomial._sign_changes(sequence, right) + at_left
+
+    def _is_same_multiple_root(self, a: float, b: float) -> bool:
+        # one multiple root: p stays at the rounding level between the candidates and p' vanishes at both,
+        # distinct roots closer than about sqrt(eps) still can't be told apart
+        epsilon = sys.float_info.epsilon
+        derivative = self.derivative()
+        middle = a + (b - a) / 2
+        return abs(self.at(middle)) <= epsilon * self._magnitude(middle) \
+            and all(abs(derivative.at(x)) <= math.sqrt(epsilon) * derivative._magnitude(x) for x in (a, b))
+
+    def _magnitude(self, x: float) -> float:
+        return Polynomial._horner([abs(c) for c in self.coefficients], abs(x))
+
+    @staticmethod
+    def _remainder(dividend: list[float], divisor: list[float], tolerance: float = 1e-12) -> list[float]:
+        remainder = list(dividend)
+        while len(remainder) >= len(divisor):
+            factor = remainder[0] / divisor[0]
+            for i in range(len(divisor)):
+                remainder[i] -= factor * divisor[i]
+            remainder.pop(0)
+        scale = max(abs(c) for c in dividend)
+        while len(remainder) > 0 and abs(remainder[0]) <= tolerance * scale:
+            remainder.pop(0)
+        return remainder
+
+    @staticmethod
+    def _sign_changes(sequence: list[list[float]], x: float) -> int:
+        signs = [v for v in (Polynomial._horner(p, x) for p in sequence) if v != 0]
+        return sum(1 for a, b in zip(signs, signs[1:]) if a * b < 0)
+
+    @staticmethod
+    def _horner(coefficients: list[float], x):
+        result = coefficients[0] + 0 * x
+        for coefficient in coefficients[1:]:
+            result = result * x + coefficient
+        return result
+
+
+class ChebyshevProxy(Function):
+    source: Function = None
+    left: float = 0
+    right: float = 0
+    coefficients: list[float] = None    # of the Chebyshev series on [left, right]
+    evaluations: int = 0    # number of source evaluations spent on building and polishing
+
+    def __init__(self, source: Function, left: float, right: float, precision: float = 1e-10,
+                 min_degree: int = 16, max_degree: int = 256):
+        assert right > left, "Wrong interval"
+        super().__init__(f"chebyshev proxy of {source.string} at [{left}, {right}]",
+                         lambda x: ChebyshevProxy._clenshaw(self.coefficients, self._to_unit(x)))
+        self.source = source
+        self.left = left
+        self.right = right
+        self._roots = None
+        self.coefficients = self._build(precision, min_degree, max_degree)
+
+    def roots_on_interval(self, left: float, right: float) -> list[float]:
+        assert right > left, "Wrong interval"
+        if self._roots is None:
+            self._roots = self._find_roots()
+        return [root for root in self._roots if left <= root <= right]
+
+    def _find_roots(self, precision: float = 1e-12, max_polish_iterations: int = 5) -> list[float]:
+        # roots on the whole proxy interval, polished once, so later calls cost no source evaluations
+        import numpy as np
+
+        # chebroots computes eigenvalues of the colleague matrix
+        candidates = np.polynomial.chebyshev.chebroots(self.coefficients) if len(self.coefficients) > 1 else []
+        polished: list[tuple[float, float]] = []
+        for candidate in candidates:
+            if abs(candidate.imag) > 1e-6 or abs(candidate.real) > 1 + 1e-6:
+                continue
+            x = self._from_unit(float(candidate.real))
+            for _ in range(max_polish_iterations):
+                derivative_at_x = self.derivative_at(x)
+                if derivative_at_x == 0:
+                    break
+                self.evaluations += 1
+                step = self.source.at(x) / derivative_at_x
+                x -= step
+                if abs(step) < precision * max(1.0, abs(x)):
+                    break
+            if self.left <= x <= self.right:
+                self.evaluations += 1
+                polished.append((x, abs(self.source.at(x))))
+        polished.sort()
+        # near a multiple root polishing only reaches about sqrt(eps), so such copies are one root
+        tolerance = math.sqrt(sys.float_info.epsilon) * max(1.0, self.right - self.left)
+        roots: list[tuple[float, float]] = []
+        for x, residual in polished:
+            if len(roots) > 0 and x - roots[-1][0] <= tolerance:
+                if residual < roots[-1][1]:
+                    roots[-1] = (x, residual)
+            else:
+                roots.append((x, residual))
+        return [x for x, _ in roots]
+
+    def has_one_root_on_interval(self, left: float, right: float, number_of_intervals_to_split: int = 1000) -> bool:
+        assert right > left, "Wrong interval"
+        if self.at(left) * self.at(right) > 0:
+            return False
+        return len(self.roots_on_interval(left, right)) == 1
+
+    def _build(self, precision: float, min_degree: int, max_degree: int) -> list[float]:
+        import numpy as np
+
+        degree = min_degree
+        values = np.array([self._sample(np.cos(np.pi * j / degree)) for j in range(degree + 1)])
+        while True:
+            # values at the Chebyshev points cos(pi * j / degree) to series coefficients
+            extended = np.concatenate((values, values[-2:0:-1]))
+            coefficients = np.real(np.fft.fft(extended))[:degree + 1] / degree
+            coefficients[0] /= 2
+            coefficients[-1] /= 2
+
+            scale = max(np.max(np.abs(coefficients)), 1e-300)
+            if np.max(np.abs(coefficients[-3:])) <= precision * scale:
+                significant = np.nonzero(np.abs(coefficients) > precision * scale)[0]
+                return coefficients[:significant[-1] + 1].tolist() if len(significant) > 0 else [0.0]
+            if 2 * degree > max_degree:
+                raise Exception(f"Chebyshev approximation didn't converge with degree {max_degree}")
+
+            # points of the doubled degree include all current ones, so only odd ones are new
+            refined = np.empty(2 * degree + 1)
+            refined[0::2] = values
+            refined[1::2] = [self._sample(np.cos(np.pi * j / (2 * degree))) for j in range(1, 2 * degree, 2)]
+            values = refined
+            degree *= 2
+
+    def _sample(self, t: float) -> float:
+        self.evaluations += 1
+        return self.source.at(self._from_unit(float(t)))
+
+    def _to_unit(self, x):
+        return (2 * x - self.left - self.right) / (self.right - self.left)
+
+    def _from_unit(self, t):
+        return (self.left + self.right) / 2 + (self.right - self.left) / 2 * t
+
+    @staticmethod
+    def _clenshaw(coefficients: list[float], t):
+        b1, b2 = 0 * t, 0 * t
+        for coefficient in reversed(coefficients[1:]):
+            b1, b2 = 2 * t * b1 - b2 + coefficient, b1
+        return t * b1 - b2 + coefficients[0]
+
+
 def _get_polynomial_function() -> Function:
-    return Function(
+    return Polynomial(
         "-0.38 * x^3 - 3.42 * x^2 + 2.51 * x + 8.75",
-        lambda x: -0.38 * x**3 - 3.42 * x**2 + 2.51 * x + 8.75
+        [-0.38, -3.42, 2.51, 8.75]
     )
 
 
@@ -1,5 +1,6 @@
-import math
-from typing import Callable
+from typing import Callable, Optional
+
+from interval_arithmetic import Interval, Dual, cos, sin
 
 
 # noinspection DuplicatedCode
@@ -7,11 +8,14 @@ class ManyArgumentFunction:
     string: str = ""
     argc: int = 0
     func: Callable[[list[float]], float] = lambda args: 0
+    dependencies: list[int] = None    # indices of the arguments the function actually uses
 
-    def __init__(self, s, a, f):
+    def __init__(self, s, a, f, d: list[int] = None):
+        assert d is None or all(map(lambda i: 0 <= i < a, d)), "Dependency is out of range"
         self.string = s
         self.argc = a
         self.func = f
+        self.dependencies = list(range(a)) if d is None else sorted(set(d))
 
     def at(self, x: list[float]) -> float:
         assert self.argc == len(x), "Wrong amount of arguments"
@@ -34,6 +38,16 @@ class ManyArgumentFunction:
 
         return 1/3 * left_d + 1/3 * center_d + 1/3 * right_d
 
+    def at_box(self, box: list[Interval]) -> Interval:
+        return Interval.of(self.at(box))
+
+    def gradient_on_box(self, box: list[Interval]) -> list[Interval]:
+        assert self.argc == len(box), "Wrong amount of arguments"
+        result = self.func(Dual.variables(box))
+        if not isinstance(result, Dual):
+            return [Interval(0)] * self.argc
+        return [Interval.of(d) for d in result.gradient]
+
     def __str__(self):
         return "function: (" + self.string + ")"
 
@@ -41,6 +55,8 @@ class ManyArgumentFunction:
 class EquationSystem:
     image: str = ""
     funcs: list[ManyArgumentFunction] = None
+    _column_groups: list[list[int]] = None
+    _rows_of_columns: list[list[int]] = None
 
     def __init__(self, im: str, fs: list[ManyArgumentFunction]):
         assert len(fs) > 0, "Not enough functions"
@@ -50,6 +66,101 @@ class EquationSystem:
         self.image = im
         self.funcs = fs
 
+    def jacobian_at(self, point: list[float], precision: float = 1e-5):
+        # sparse jacobian of F(x) = G(x) - x, columns without common rows are differentiated together
+        from scipy.sparse import csr_matrix
+
+        step = precision / 2
+        rows, cols, data = [], [], []
+        for group in self.column_groups():
+            column_of_row = {}
+            for col in group:
+                for row in self._rows_of_column()[col]:
+                    column_of_row[row] = col
+            left, right = point.copy(), point.copy()
+            for col in group:
+                left[col] -= step
+                right[col] += step
+            for row, col in column_of_row.items():
+                derivative = (self.funcs[row].at(right) - self.funcs[row].at(left)) / precision
+                rows.append(row)
+                cols.append(col)
+                data.append(derivative - (1 if row == col else 0))
+        n = len(self.funcs)
+        return csr_matrix((data, (rows, cols)), shape=(n, n))
+
+    def column_groups(self) -> list[list[int]]:
+        # greedy coloring of the column intersection graph
+        if self._column_groups is None:
+            groups: list[list[int]] = []
+            used_rows: list[set[int]] = []
+            for col, rows in enumerate(self._rows_of_column()):
+                for group, used in zip(groups, used_rows):
+                    if used.isdisjoint(rows):
+                        group.append(col)
+                        used.update(rows)
+                        break
+                else:
+                    groups.append([col])
+                    used_rows.append(set(rows))
+            self._column_groups = groups
+        return self._column_groups
+
+    def _rows_of_column(self) -> list[list[int]]:
+        if self._rows_of_columns is None:
+            rows_of_columns = [[i] for i in range(len(self.funcs))]    # the -x term of F(x) = G(x) - x
+            for row, func in enumerate(self.funcs):
+                for col in func.dependencies:
+                    if col != row:
+                        rows_of_columns[col].append(row)
+            self._rows_of_columns = rows_of_columns
+        return self._rows_of_columns
+
+    def certify_unique_root(self, intervals: list[list[float]], max_depth: int = 10) -> Optional[list[Interval]]:
+        # Krawczyk test for F(x) = G(x) - x, where the system is given as x = G(x)
+        certified: list[list[Interval]] = []
+        boxes = [([Interval(lo, hi) for lo, hi in intervals], 0)]
+        while len(boxes) > 0:
+            box, depth = boxes.pop()
+            krawczyk = self._krawczyk(box)
+            if krawczyk is not None:
+                if any(k.intersect(x) is None for k, x in zip(krawczyk, box)):
+                    continue
+                if all(k.is_inside(x) for k, x in zip(krawczyk, box)):
+                    certified.append(box)
+                    continue
+            if depth >= max_depth:
+                return None
+            widest = max(range(len(box)), key=lambda i: box[i].width())
+            for half in box[widest].split():
+                boxes.append((box[:widest] + [half] + box[widest + 1:], depth + 1))
+        return certified[0] if len(certified) == 1 else None
+
+    def _krawczyk(self, box: list[Interval]) -> Optional[list[Interval]]:
+        n = len(box)
+        y = [x.mid() for x in box]
+        at_y = [func.at_box([Interval(v) for v in y]) - y[i] for i, func in enumerate(self.funcs)]
+        jacobian_at_y = [func.func(Dual.variables(y)) for func in self.funcs]
+        jacobian_at_y = [[(d.gradient[j] if isinstance(d, Dual) else 0) - (1 if i == j else 0) for j in range(n)]
+                         for i, d in enumerate(jacobian_at_y)]
+        c = _inverse(jacobian_at_y)
+        if c is None:
+            return None
+        jacobian = [[g - (1 if i == j else 0) for j, g in enumerate(func.gradient_on_box(box))]
+                    for i, func in enumerate(self.funcs)]
+        result = []
+        for i in range(n):
+            k = Interval(y[i])
+            for j in range(n):
+                k = k - c[i][j] * at_y[j]
+            for m in range(n):
+                factor = Interval(1 if i == m else 0)
+                for j in range(n):
+                    factor = factor - c[i][j] * jacobian[j][m]
+                k = k + factor * (box[m] - y[m])
+            result.append(k)
+        return result
+
     def __str__(self):
         top = self.funcs[0]
         middle = self.funcs[1:-1]
@@ -61,6 +172,23 @@ class EquationSystem:
         return system
 
 
+def _inverse(matrix: list[list[float]]) -> Optional[list[list[float]]]:
+    n = len(matrix)
+    augmented = [list(row) + [1.0 if i == j else 0.0 for j in range(n)] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(augmented[r][col]))
+        if augmented[pivot][col] == 0:
+            return None
+        augmented[col], augmented[pivot] = augmented[pivot], augmented[col]
+        divisor = augmented[col][col]
+        augmented[col] = [v / divisor for v in augmented[col]]
+        for r in range(n):
+            if r != col and augmented[r][col] != 0:
+                factor = augmented[r][col]
+                augmented[r] = [a - factor * b for a, b in zip(augmented[r], augmented[col])]
+    return [row[n:] for row in augmented]
+
+
 def _get_classes_system() -> EquationSystem:
     return EquationSystem(
         "system_plots/0.png",
@@ -86,12 +214,14 @@ def _get_internet_system() -> EquationSystem:
             ManyArgumentFunction(
                 "x_0 = 1/3 * cos(x_1) + 1.3",
                 2,
-                lambda args: 1/3 * math.cos(args[1]) + 1.3     # == args[0]
+                lambda args: 1/3 * cos(args[1]) + 1.3,     # == args[0]
+                [1]
             ),
             ManyArgumentFunction(
                 "x_1 = sin(x_0 - 0.6) - 1.6",
                 2,
-                lambda args: math.sin(args[0] - 0.6) - 1.6     # == args[1]
+                lambda args: sin(args[0] - 0.6) - 1.6,     # == args[1]
+                [0]
             )
         ]
     )
@@ -0,0 +1,204 @@
+import math
+import sys
+from typing import Callable
+
+
+def _down(x: float) -> float:
+    return math.nextafter(x, -math.inf)
+
+
+def _up(x: float) -> float:
+    return math.nextafter(x, math.inf)
+
+
+class Interval:
+    lo: float = 0
+    hi: float = 0
+
+    def __init__(self, lo: float, hi: float = None):
+        hi = lo if hi is None else hi
+        assert lo <= hi, "Wrong interval"
+        self.lo = lo
+        self.hi = hi
+
+    def mid(self) -> float:
+        return self.lo + (self.hi - self.lo) / 2
+
+    def width(self) -> float:
+        return self.hi - self.lo
+
+    def magnitude(self) -> float:
+        return max(abs(self.lo), abs(self.hi))
+
+    def intersect(self, other: "Interval") -> "Interval":
+        lo, hi = max(self.lo, other.lo), min(self.hi, other.hi)
+        return Interval(lo, hi) if lo <= hi else None
+
+    def is_inside(self, other: "Interval") -> bool:
+        return other.lo < self.lo and self.hi < other.hi
+
+    def split(self) -> list["Interval"]:
+        middle = self.mid()
+        return [Interval(self.lo, middle), Interval(middle, self.hi)]
+
+    def sin(self) -> "Interval":
+        # maxima of sin are at pi/2 + 2 pi k, minima at -pi/2 + 2 pi k
+        return self._periodic(math.sin, math.pi / 2, -math.pi / 2)
+
+    def cos(self) -> "Interval":
+        # maxima of cos are at 2 pi k, minima at pi + 2 pi k
+        return self._periodic(math.cos, 0, math.pi)
+
+    def _periodic(self, func: Callable[[float], float], maximum: float, minimum: float) -> "Interval":
+        if self.width() >= 2 * math.pi:
+            return Interval(-1, 1)
+        lo, hi = sorted((func(self.lo), func(self.hi)))
+        if self._contains_period_point(maximum):
+            hi = 1
+        if self._contains_period_point(minimum):
+            lo = -1
+        # math.sin and math.cos are not correctly rounded, so the bounds are widened by two ulps
+        return Interval(max(_down(_down(lo)), -1), min(_up(_up(hi)), 1))
+
+    def _contains_period_point(self, phase: float) -> bool:
+        # math.pi isn't exact, so points of the period are searched a few ulps around the interval
+        tolerance = 8 * sys.float_info.epsilon * max(1.0, abs(self.lo), abs(self.hi))
+        k = math.ceil((self.lo - tolerance - phase) / (2 * math.pi))
+        return phase + 2 * math.pi * k <= self.hi + tolerance
+
+    @staticmethod
+    def of(x) -> "Interval":
+        return x if isinstance(x, Interval) else Interval(x)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return NotImplemented
+        other = Interval.of(other)
+        return Interval(_down(self.lo + other.lo), _up(self.hi + other.hi))
+
+    def __radd__(self, other):
+        return self + other
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return NotImplemented
+        return self + (-Interval.of(other))
+
+    def __rsub__(self, other):
+        return Interval.of(other) - self
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return NotImplemented
+        other = Interval.of(other)
+        products = [self.lo * other.lo, self.lo * other.hi, self.hi * other.lo, self.hi * other.hi]
+        return Interval(_down(min(products)), _up(max(products)))
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return NotImplemented
+        other = Interval.of(other)
+        if other.lo <= 0 <= other.hi:
+            raise Exception(f"Division by interval containing zero ({other})")
+        quotients = [self.lo / other.lo, self.lo / other.hi, self.hi / other.lo, self.hi / other.hi]
+        return Interval(_down(min(quotients)), _up(max(quotients)))
+
+    def __rtruediv__(self, other):
+        return Interval.of(other) / self
+
+    def __pow__(self, power: int):
+        assert isinstance(power, int) and power >= 0, "Only non-negative integer powers are supported"
+        if power == 0:
+            return Interval(1)
+        lo, hi = sorted((self.lo ** power, self.hi ** power))
+        if power % 2 == 0 and self.lo <= 0 <= self.hi:
+            lo = 0
+        return Interval(_down(_down(lo)) if lo != 0 else 0, _up(_up(hi)))
+
+    def __str__(self):
+        return f"[{self.lo}, {self.hi}]"
+
+    __repr__ = __str__
+
+
+# forward mode automatic differentiation, values and gradients may be floats or intervals
+class Dual:
+    value = 0
+    gradient: list = None
+
+    def __init__(self, value, gradient: list):
+        self.value = value
+        self.gradient = gradient
+
+    @staticmethod
+    def variables(values: list) -> list["Dual"]:
+        return [Dual(value, [1 if i == j else 0 for j in range(len(values))]) for i, value in enumerate(values)]
+
+    @staticmethod
+    def of(x, size: int) -> "Dual":
+        return x if isinstance(x, Dual) else Dual(x, [0] * size)
+
+    def __add__(self, other):
+        other = Dual.of(other, len(self.gradient))
+        return Dual(self.value + other.value, [a + b for a, b in zip(self.gradient, other.gradient)])
+
+    def __radd__(self, other):
+        return self + other
+
+    def __neg__(self):
+        return Dual(-self.value, [-a for a in self.gradient])
+
+    def __sub__(self, other):
+        return self + (-Dual.of(other, len(self.gradient)))
+
+    def __rsub__(self, other):
+        return Dual.of(other, len(self.gradient)) - self
+
+    def __mul__(self, other):
+        other = Dual.of(other, len(self.gradient))
+        return Dual(self.value * other.value,
+                    [self.value * b + other.value * a for a, b in zip(self.gradient, other.gradient)])
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        other = Dual.of(other, len(self.gradient))
+        square = other.value ** 2
+        return Dual(self.value / other.value,
+                    [(a * other.value - self.value * b) / square for a, b in zip(self.gradient, other.gradient)])
+
+    def __rtruediv__(self, other):
+        return Dual.of(other, len(self.gradient)) / self
+
+    def __pow__(self, power: int):
+        assert isinstance(power, int) and power >= 0, "Only non-negative integer powers are supported"
+        if power == 0:
+            return Dual(1, [0] * len(self.gradient))
+        factor = power * self.value ** (power - 1)
+        return Dual(self.value ** power, [factor * a for a in self.gradient])
+
+
+def sin(x):
+    if isinstance(x, Dual):
+        factor = cos(x.value)
+        return Dual(sin(x.value), [factor * a for a in x.gradient])
+    if isinstance(x, Interval):
+        return x.sin()
+    return math.sin(x)
+
+
+def cos(x):
+    if isinstance(x, Dual):
+        factor = -sin(x.value)
+        return Dual(cos(x.value), [factor * a for a in x.gradient])
+    if isinstance(x, Interval):
+        return x.cos()
+    return math.cos(x)
+
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+class IterationTable:
+    columns: list[str] = None
+    history_size: int = None
+
+    def __init__(self, columns: list[str], history_size: int = None, capacity: int = 64):
+        assert len(columns) > 0, "Not enough columns"
+        assert history_size is None or history_size > 0, "History size must be positive"
+        assert capacity > 0, "Capacity must be positive"
+        self.columns = columns
+        self.history_size = history_size
+        # with bounded history the buffer is a ring of exactly history_size rows
+        self._capacity = capacity if history_size is None else history_size
+        # column-major: column i occupies [i * capacity, (i + 1) * capacity)
+        self._data = IterationTable._allocate(self._capacity * len(columns))
+        self._count = 0
+
+    def append(self, line: list[float]):
+        assert len(line) == len(self.columns), "Wrong amount of values"
+        if self.history_size is None and self._count == self._capacity:
+            self._grow()
+        position = self._count % self._capacity
+        for i, value in enumerate(line):
+            self._data[i * self._capacity + position] = value
+        self._count += 1
+
+    def clear(self):
+        self._count = 0
+
+    def last(self) -> array:
+        assert self._count > 0, "Table is empty"
+        position = (self._count - 1) % self._capacity
+        return array("d", (self._data[i * self._capacity + position] for i in range(len(self.columns))))
+
+    # rows() and to_frame() are views of the buffer (unless the ring has wrapped, then they are copies):
+    # later appends overwrite them in ring mode, and they stop following the table once it grows
+    def rows(self) -> np.ndarray:
+        import numpy as np
+
+        columns = np.frombuffer(self._data).reshape(len(self.columns), self._capacity)
+        if self.history_size is None or self._count <= self.history_size:
+            return columns[:, :self._count].T
+        start = self._count % self._capacity
+        return np.concatenate((columns[:, start:], columns[:, :start]), axis=1).T
+
+    def to_frame(self) -> pd.DataFrame:
+        import pandas as pd
+
+        rows = self.rows()
+        index = pd.RangeIndex(self._count - len(rows), self._count)
+        return pd.DataFrame(data=rows, columns=self.columns, index=index, copy=False)
+
+    def _grow(self):
+        capacity = 2 * self._capacity
+        grown = IterationTable._allocate(capacity * len(self.columns))
+        for i in range(len(self.columns)):
+            grown[i * capacity:i * capacity + self._capacity] = \
+                self._data[i * self._capacity:(i + 1) * self._capacity]
+        self._data = grown
+        self._capacity = capacity
+
+    @staticmethod
+    def _allocate(size: int) -> array:
+        return array("d", bytes(8 * size))
+
+    def __len__(self):
+        return self._count
@@ -1,12 +1,15 @@
+from __future__ import annotations
+
 import sys
 import warnings
-import numpy as np
-import matplotlib
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
 
 from functions import *
 from root_methods import *
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def choose_function() -> Function:
     functions: list[Function] = get_all_functions()
@@ -36,6 +39,8 @@ def read_interval() -> [float, float]:
 
 
 def read_interval_from_file(filename: str):
+    import pandas as pd
+
     frame: pd.DataFrame
     try:
         frame = pd.read_csv(filename, header=None)
@@ -46,6 +51,8 @@ def read_interval_from_file(filename: str):
 
 
 def validate_file_interval(frame: pd.DataFrame):
+    import numpy as np
+
     if len(frame) != 1 or len(frame[0]) != 2 or not isinstance(frame[0][0], np.float) \
             or not isinstance(frame[0][1], np.float) or frame[0][1] < frame[0][0]:
         raise Exception("must contains only two float numbers (forming interval)")
@@ -64,6 +71,8 @@ def read_precision() -> float:
 
 
 def read_precision_from_file(filename: str):
+    import pandas as pd
+
     frame: pd.DataFrame
     try:
         frame = pd.read_csv(filename, header=None)
@@ -74,6 +83,8 @@ def read_precision_from_file(filename: str):
 
 
 def validate_file_precision(frame: pd.DataFrame):
+    import numpy as np
+
     if len(frame) != 1 or len(frame[0]) != 1 or not isinstance(frame[0][0], np.float) or frame[0][0] <= 0:
         raise Exception("must contains only one number (positive float)")
 
@@ -93,11 +104,14 @@ def choose_method() -> RootFindMethod:
         raise Exception("can't choose the method: " + e.__str__())
 
 
-def print_result(result: pd.DataFrame, method: RootFindMethod, function: Function):
-    print("\nHere is the computation result:")
-    pd.options.display.max_columns = None
-    pd.options.display.max_rows = None
-    print(result)
+def print_result(result: IterationTable, method: RootFindMethod, function: Function, headless: bool = False):
+    if not headless:
+        import pandas as pd
+
+        print("\nHere is the computation result:")
+        pd.options.display.max_columns = None
+        pd.options.display.max_rows = None
+        print(result.to_frame())
     answer = method.extract_answer(result)
     print(f"""
     End the final answer is: x = {answer}
@@ -107,7 +121,11 @@ def print_result(result: pd.DataFrame, method: RootFindMethod, function: Functio
 
 
 def show_plot(function: Function, left: float, right: float, number_of_points: int = 10000,
-              result: pd.DataFrame = None, method: RootFindMethod = None):
+              result: IterationTable = None, method: RootFindMethod = None):
+    import numpy as np
+    import matplotlib
+    import matplotlib.pyplot as plt
+
     x = np.arange(left, right, (right - left) / number_of_points)
     y = np.array([function.at(val) for val in x])
     warnings.filterwarnings("ignore", category=matplotlib.MatplotlibDeprecationWarning)
@@ -122,24 +140,60 @@ def show_plot(function: Function, left: float, right: float, number_of_points: i
     plt.show()
 
 
-def run():
+def save_trace(path: str, result: IterationTable, method: RootFindMethod, answer: float):
+    from trace_store import TraceWriter
+
+    try:
+        with TraceWriter(path) as writer:
+            job = writer.write(result, method, answer)
+        print(f"Trace saved to \"{path}\" as job {job}")
+    except Exception as e:
+        raise Exception("can't save the trace: " + e.__str__())
+
+
+def get_option(name: str) -> str:
+    for arg in sys.argv[1:]:
+        if arg.startswith(name + "="):
+            return arg[len(name) + 1:]
+    return None
+
+
+def read_history_size(option: str) -> int:
+    if option is None:
+        return None
+    try:
+        history_size = int(option)
+        if history_size <= 0:
+            raise Exception("must be positive")
+        return history_size
+    except Exception as e:
+        raise Exception("can't read the history size: " + e.__str__())
+
+
+def run(headless: bool = False, chebyshev: bool = False, trace: str = None, history: str = None):
     try:
         function: Function = choose_function()
         [left, right] = read_interval()
+        solved: Function = ChebyshevProxy(function, left, right) if chebyshev else function
 
-        if not function.has_one_root_on_interval(left, right):
-            show_plot(function, left, right)
+        if not solved.has_one_root_on_interval(left, right):
+            if not headless:
+                show_plot(function, left, right)
             raise Exception("Sorry can't tell you anything about that interval of that function "
                             "(possibly there are 0 or more then 1 roots here)")
 
         precision: float = read_precision()
         method: RootFindMethod = choose_method()
-        result: pd.DataFrame = method.evaluate_root(function, left, right, precision)
-        print_result(result, method, function)
-        show_plot(function, left, right, result=result, method=method)
+        history_size = read_history_size(history)
+        result: IterationTable = method.evaluate_root(solved, left, right, precision, history_size=history_size)
+        print_result(result, method, function, headless)
+        if trace is not None:
+            save_trace(trace, result, method, method.extract_answer(result))
+        if not headless:
+            show_plot(function, left, right, result=result, method=method)
     except Exception as e:
         print(e, file=sys.stderr)
 
 
 if __name__ == '__main__':
-    run()
+    run("--headless" in sys.argv[1:], "--chebyshev" in sys.argv[1:], get_option("--trace"), get_option("--history"))
@@ -1,5 +1,4 @@
 import sys
-from PIL import Image
 
 from root_methods_system import *
 
@@ -21,6 +20,8 @@ def choose_system() -> EquationSystem:
 
 def show_plot(system: EquationSystem):
     try:
+        from PIL import Image
+
         image = Image.open(system.image)
         image.show(system.__str__())
         print("\nI drawn a plot for you, look at It before continue.")
@@ -85,41 +86,79 @@ def choose_method() -> SystemRootFindMethod:
         raise Exception("can't choose the method: " + e.__str__())
 
 
-def print_result(result: pd.DataFrame, method: SystemRootFindMethod, system: EquationSystem):
-    print("\nHere is the computation result:")
+def print_result(result: IterationTable, method: SystemRootFindMethod, system: EquationSystem,
+                 headless: bool = False):
+    if not headless:
+        import pandas as pd
+
+        print("\nHere is the computation result:")
 
-    pd.options.display.max_columns = None
-    pd.options.display.max_rows = None
-    print(result)
+        pd.options.display.max_columns = None
+        pd.options.display.max_rows = None
+        print(result.to_frame())
 
     answer = method.extract_answer(result)
     print("\nEnd the final answer is:")
     for i, ans in enumerate(answer):
         print(f"x_{i} = {ans}")
 
-    print(f"Number of iterations: {len(result.values)}")
+    print(f"Number of iterations: {len(result)}")
 
     print(f"Precisions:")
     for i, func in enumerate(system.funcs):
         print(f"{i}: {answer[i] - func.at(answer)}")
 
 
-def run():
+def save_trace(path: str, result: IterationTable, method: SystemRootFindMethod, answer: list[float]):
+    from trace_store import TraceWriter
+
+    try:
+        with TraceWriter(path) as writer:
+            job = writer.write(result, method, answer)
+        print(f"Trace saved to \"{path}\" as job {job}")
+    except Exception as e:
+        raise Exception("can't save the trace: " + e.__str__())
+
+
+def get_option(name: str) -> str:
+    for arg in sys.argv[1:]:
+        if arg.startswith(name + "="):
+            return arg[len(name) + 1:]
+    return None
+
+
+def read_history_size(option: str) -> int:
+    if option is None:
+        return None
+    try:
+        history_size = int(option)
+        if history_size <= 0:
+            raise Exception("must be positive")
+        return history_size
+    except Exception as e:
+        raise Exception("can't read the history size: " + e.__str__())
+
+
+def run(headless: bool = False, trace: str = None, history: str = None):
     try:
         system: EquationSystem = choose_system()
-        show_plot(system)
+        if not headless:
+            show_plot(system)
 
         intervals: list[list[float]] = read_intervals(len(system.funcs))
         start: list[float] = read_start(intervals)
         precision: float = read_precision()
         method: SystemRootFindMethod = choose_method()
 
-        result: pd.DataFrame = method.evaluate_root(system, intervals, start, precision)
-        print_result(result, method, system)
+        history_size = read_history_size(history)
+        result: IterationTable = method.evaluate_root(system, intervals, start, precision, history_size=history_size)
+        print_result(result, method, system, headless)
+        if trace is not None:
+            save_trace(trace, result, method, method.extract_answer(result))
         # show_plot(function, left, right, result=result, method=method)
     except Exception as e:
         print(e, file=sys.stderr)
 
 
 if __name__ == '__main__':
-    run()
+    run("--headless" in sys.argv[1:], get_option("--trace"), get_option("--history"))
@@ -1,14 +1,15 @@
-import pandas as pd
-from functions import Function
+from functions import Function, Polynomial, ChebyshevProxy
+from iteration_table import IterationTable
 
 
 class RootFindMethod:
     string: str = ""
 
-    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4) -> pd.DataFrame:
+    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4,
+                      history_size: int = None) -> IterationTable:
         raise Exception("Method isn't overridden")
 
-    def extract_answer(self, result: pd.DataFrame) -> float:
+    def extract_answer(self, result: IterationTable) -> float:
         raise Exception("Method isn't overridden")
 
     def __str__(self):
@@ -19,8 +20,9 @@ class HalfDivisionMethod(RootFindMethod):
     string: str = "half division method"
     _half_division_method_table_cols = ["a", "b", "x", "f(a)", "f(b)", "f(x)", "|a - b|"]
 
-    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4) -> pd.DataFrame:
-        table: list[list] = list()
+    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4,
+                      history_size: int = None) -> IterationTable:
+        table = IterationTable(self._half_division_method_table_cols, history_size)
         while True:
             line = [left, right]
 
@@ -49,18 +51,19 @@ class HalfDivisionMethod(RootFindMethod):
             if interval < precision and abs(at_x) < precision:
                 break
 
-        return pd.DataFrame(data=table, columns=self._half_division_method_table_cols)
+        return table
 
-    def extract_answer(self, result: pd.DataFrame) -> float:
-        return result.values[-1][2]
+    def extract_answer(self, result: IterationTable) -> float:
+        return result.last()[2]
 
 
 class ChordMethod(RootFindMethod):
     string: str = "chord method"
     _chord_method_table_cols = ["a", "b", "x", "f(a)", "f(b)", "f(x)", "|x_(n+1) - x_n|"]
 
-    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4) -> pd.DataFrame:
-        table: list[list] = list()
+    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4,
+                      history_size: int = None) -> IterationTable:
+        table = IterationTable(self._chord_method_table_cols, history_size)
         last_x = left
         while True:
             line = [left, right]
@@ -92,19 +95,20 @@ class ChordMethod(RootFindMethod):
             if change < precision and abs(at_x) < precision:
                 break
 
-        return pd.DataFrame(data=table, columns=self._chord_method_table_cols)
+        return table
 
-    def extract_answer(self, result: pd.DataFrame) -> float:
-        return result.values[-1][2]
+    def extract_answer(self, result: IterationTable) -> float:
+        return result.last()[2]
 
 
 class NewtonMethod(RootFindMethod):
     string: str = "newton method"
     _newton_method_table_cols = ["x_k", "f(x_k)", "f'(x_k)", "x_(k+1)", "|x_(k+1) - x_k|"]
 
-    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4) -> pd.DataFrame:
+    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4,
+                      history_size: int = None) -> IterationTable:
         NewtonMethod._check_usability(func, left, right, precision)
-        table: list[list] = list()
+        table = IterationTable(self._newton_method_table_cols, history_size)
         x = left if (func.at(left) * func.double_derivative_at(left) > 0) else right
         while True:
             line = [x]
@@ -129,10 +133,10 @@ class NewtonMethod(RootFindMethod):
             if change < precision and abs(step) < precision and abs(at_x) < precision:
                 break
 
-        return pd.DataFrame(data=table, columns=self._newton_method_table_cols)
+        return table
 
-    def extract_answer(self, result: pd.DataFrame) -> float:
-        return result.values[-1][3]
+    def extract_answer(self, result: IterationTable) -> float:
+        return result.last()[3]
 
     @staticmethod
     def _check_usability(func: Function, left: float, right: float, precision: float = 1e-4,
@@ -154,8 +158,9 @@ class SecantMethod(RootFindMethod):
     _secant_method_table_cols = ["x_(k-1)", "x_k", "x_(k+1)", "f(x_(k+1))", "|x_(k+1) - x_k|"]
 
     def evaluate_root(self, func: Function, left: float, right: float,
-                      precision: float = 1e-4, first_offset: float = 0.1) -> pd.DataFrame:
-        table: list[list] = list()
+                      precision: float = 1e-4, first_offset: float = 0.1,
+                      history_size: int = None) -> IterationTable:
+        table = IterationTable(self._secant_method_table_cols, history_size)
         prev_x = left if (func.at(left) * func.double_derivative_at(left) > 0) else right
         x = (prev_x + first_offset) if (prev_x == left) else (prev_x - first_offset)
         while True:
@@ -180,10 +185,10 @@ class SecantMethod(RootFindMethod):
             if change < precision and abs(at_next_x) < precision:
                 break
 
-        return pd.DataFrame(data=table, columns=self._secant_method_table_cols)
+        return table
 
-    def extract_answer(self, result: pd.DataFrame) -> float:
-        return result.values[-1][2]
+    def extract_answer(self, result: IterationTable) -> float:
+        return result.last()[2]
 
 
 class SimpleIterationMethod(RootFindMethod):
@@ -191,8 +196,9 @@ class SimpleIterationMethod(RootFindMethod):
     _simple_iteration_method_table_cols = ["x_k", "x_(k+1)", "f(x_(k+1))", "|x_(k+1) - x_k|"]
 
     def evaluate_root(self, func: Function, left: float, right: float,
-                      precision: float = 1e-4, number_of_steps: int = 10000) -> pd.DataFrame:
-        table: list[list] = list()
+                      precision: float = 1e-4, number_of_steps: int = 10000,
+                      history_size: int = None) -> IterationTable:
+        table = IterationTable(self._simple_iteration_method_table_cols, history_size)
 
         k = abs(func.derivative_at(left))
         step = (right - left) / number_of_steps
@@ -210,7 +216,7 @@ class SimpleIterationMethod(RootFindMethod):
         stopped_x = self._try_iteration(func, transformed_func, table, left, right, precision)
 
         if stopped_x < left or stopped_x > right:
-            table = list()
+            table.clear()
             transformed_func = Function(
                 f"x - ({lambda_coefficient}) * ({func.string})",
                 lambda x: x - lambda_coefficient * func.at(x)
@@ -221,10 +227,10 @@ class SimpleIterationMethod(RootFindMethod):
             if stopped_x < left or stopped_x > right:
                 raise Exception("Simple iteration method is annihilated (mission accomplished)")
 
-        return pd.DataFrame(data=table, columns=self._simple_iteration_method_table_cols)
+        return table
 
     @staticmethod
-    def _try_iteration(func: Function, transformed_func: Function, table: list[list],
+    def _try_iteration(func: Function, transformed_func: Function, table: IterationTable,
                        left: float, right: float, precision: float) -> float:
         x = left
         while left <= x <= right:
@@ -247,8 +253,27 @@ class SimpleIterationMethod(RootFindMethod):
                 break
         return x
 
-    def extract_answer(self, result: pd.DataFrame) -> float:
-        return result.values[-1][1]
+    def extract_answer(self, result: IterationTable) -> float:
+        return result.last()[1]
+
+
+class PolynomialRootsMethod(RootFindMethod):
+    string: str = "polynomial roots method (companion / colleague matrix)"
+    _polynomial_roots_method_table_cols = ["x", "f(x)", "f'(x)"]
+
+    def evaluate_root(self, func: Function, left: float, right: float, precision: float = 1e-4,
+                      history_size: int = None) -> IterationTable:
+        if not isinstance(func, (Polynomial, ChebyshevProxy)):
+            raise Exception("Can't use method: function isn't a polynomial or a Chebyshev proxy")
+        table = IterationTable(self._polynomial_roots_method_table_cols, history_size)
+        for root in func.roots_on_interval(left, right):
+            table.append([root, func.at(root), func.derivative_at(root)])
+        if len(table) == 0:
+            raise Exception("Can't use method: there are no roots on the interval")
+        return table
+
+    def extract_answer(self, result: IterationTable) -> float:
+        return result.last()[0]
 
 
 def get_all_methods() -> list[RootFindMethod]:
@@ -257,5 +282,6 @@ def get_all_methods() -> list[RootFindMethod]:
         ChordMethod(),
         NewtonMethod(),
         SecantMethod(),
-        SimpleIterationMethod()
+        SimpleIterationMethod(),
+        PolynomialRootsMethod()
     ]
@@ -1,16 +1,17 @@
-import pandas as pd
+import math
 
 from functions_system import *
+from iteration_table import IterationTable
 
 
 class SystemRootFindMethod:
     string: str = ""
 
     def evaluate_root(self, system: EquationSystem, intervals: list[list[float]], start: list[float],
-                      precision: float = 1e-4) -> pd.DataFrame:
+                      precision: float = 1e-4, history_size: int = None) -> IterationTable:
         raise Exception("Method isn't overridden")
 
-    def extract_answer(self, result: pd.DataFrame) -> list[float]:
+    def extract_answer(self, result: IterationTable) -> list[float]:
         raise Exception("Method isn't overridden")
 
     def __str__(self):
@@ -21,23 +22,17 @@ class SimpleIterationSystemMethod(SystemRootFindMethod):
     string: str = "simple iteration method"
 
     def evaluate_root(self, system: EquationSystem, intervals: list[list[float]], start: list[float],
-                      precision: float = 1e-4, max_iterations: int = 10000) -> pd.DataFrame:
+                      precision: float = 1e-4, max_iterations: int = 10000,
+                      history_size: int = None) -> IterationTable:
 
-        table_cols = []
         variables_count = system.funcs[0].argc
-        for i in range(variables_count):
-            table_cols.append(f"x_{i}")
-            table_cols.append(f"|x_{i}^k - x_{i}^(k-1)|")
-
-        table = list()
-        first_line = []
-        for i in range(variables_count):
-            first_line.append(start[i])
-            first_line.append(pd.NA)
-        table.append(first_line)
+        table = _get_iteration_table(start, history_size)
 
         point = start.copy()
-        SimpleIterationSystemMethod.check_partial_derivative_at(system, point)
+        # on a certified box the convergence condition holds at every point, so it isn't rechecked
+        certified = SimpleIterationSystemMethod.is_certified_box(system, intervals)
+        if not certified:
+            SimpleIterationSystemMethod.check_partial_derivative_at(system, point)
 
         iterations = 0
         while iterations < max_iterations:
@@ -56,7 +51,8 @@ class SimpleIterationSystemMethod(SystemRootFindMethod):
                 if change > precision:
                     is_all_less_then_precision = False
 
-            SimpleIterationSystemMethod.check_partial_derivative_at(system, point)
+            if not certified:
+                SimpleIterationSystemMethod.check_partial_derivative_at(system, point)
             table.append(line)
 
             if is_all_less_then_precision:
@@ -68,27 +64,112 @@ class SimpleIterationSystemMethod(SystemRootFindMethod):
         if iterations >= max_iterations:
             raise Exception("The maximum number of iterations reached. Method didn't complete")
 
-        return pd.DataFrame(data=table, columns=table_cols)
+        return table
 
-    def extract_answer(self, result: pd.DataFrame) -> list[float]:
-        answer = []
-        last_row = result.values[-1]
-        for i in range(0, len(last_row), 2):
-            answer.append(last_row[i])
-        return answer
+    def extract_answer(self, result: IterationTable) -> list[float]:
+        return _extract_point(result)
 
     @staticmethod
     def check_partial_derivative_at(system: EquationSystem, point: list[float]):
         for func_num in range(len(system.funcs)):
             part_der_sum = 0
-            for var_num in range(len(point)):
+            for var_num in system.funcs[func_num].dependencies:
                 part_der_sum += abs(system.funcs[func_num].partial_derivative_at(point, var_num))
             if part_der_sum > 1:
                 raise Exception(f"Cannot use this method: partial derivative more than 1 "
                                 f"(equal to {part_der_sum} at point {point})")
 
+    @staticmethod
+    def is_certified_box(system: EquationSystem, intervals: list[list[float]], max_size: int = 20) -> bool:
+        # the interval jacobian is dense, so large systems are checked point by point
+        if len(system.funcs) > max_size:
+            return False
+        try:
+            if system.certify_unique_root(intervals) is None:
+                return False
+            box = [Interval(lo, hi) for lo, hi in intervals]
+            for func in system.funcs:
+                if sum(d.magnitude() for d in func.gradient_on_box(box)) >= 1:
+                    return False
+            return True
+        except Exception as _:
+            # functions that can't be evaluated over intervals are checked point by point
+            return False
+
+
+class NewtonSystemMethod(SystemRootFindMethod):
+    string: str = "newton method (sparse jacobian)"
+
+    def evaluate_root(self, system: EquationSystem, intervals: list[list[float]], start: list[float],
+                      precision: float = 1e-4, max_iterations: int = 100,
+                      history_size: int = None) -> IterationTable:
+        from scipy.sparse.linalg import spsolve
+
+        variables_count = system.funcs[0].argc
+        table = _get_iteration_table(start, history_size)
+
+        point = start.copy()
+        iterations = 0
+        while iterations < max_iterations:
+            residual = [func.at(point) - point[i] for i, func in enumerate(system.funcs)]
+            step = spsolve(system.jacobian_at(point).tocsc(), residual).tolist()
+            if not all(map(math.isfinite, step)):
+                raise Exception(f"Can't use method: jacobian is singular at point {point}")
+
+            line = []
+            new_point = point.copy()
+            is_all_less_then_precision = True
+            for i in range(variables_count):
+                new_point[i] = point[i] - step[i]
+                if new_point[i] < intervals[i][0] or new_point[i] > intervals[i][1]:
+                    raise Exception(f"Method iterated out of the searching area "
+                                    f"(new value of variable {i} is {new_point[i]} when interval is {intervals[i]})")
+                line.append(new_point[i])
+                change = abs(step[i])
+                line.append(change)
+                if change > precision:
+                    is_all_less_then_precision = False
+
+            table.append(line)
+
+            if is_all_less_then_precision:
+                break
+
+            point = new_point
+            iterations += 1
+
+        if iterations >= max_iterations:
+            raise Exception("The maximum number of iterations reached. Method didn't complete")
+
+        return table
+
+    def extract_answer(self, result: IterationTable) -> list[float]:
+        return _extract_point(result)
+
+
+def _get_iteration_table(start: list[float], history_size: int = None) -> IterationTable:
+    table_cols = []
+    first_line = []
+    for i in range(len(start)):
+        table_cols.append(f"x_{i}")
+        table_cols.append(f"|x_{i}^k - x_{i}^(k-1)|")
+        first_line.append(start[i])
+        first_line.append(float("nan"))
+    table = IterationTable(table_cols, history_size)
+    table.append(first_line)
+    return table
+
+
+def _extract_point(result: IterationTable) -> list[float]:
+    answer = []
+    last_row = result.last()
+    for i in range(0, len(last_row), 2):
+        answer.append(last_row[i])
+    return answer
+
 
 def get_all_system_methods() -> list[SystemRootFindMethod]:
     return [
-        SimpleIterationSystemMethod()
+        SimpleIterationSystemMethod(),
+        NewtonSystemMethod()
     ]
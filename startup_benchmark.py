@@ -0,0 +1,36 @@
+import statistics
+import subprocess
+import sys
+import time
+
+_runs = [
+    ("main.py", "0\n1.5 2\n0.0001\n2\n"),
+    ("main_system.py", "0\n0 1\n0 1\n0.2\n0.6\n0.0001\n0\n")
+]
+
+
+def measure(script: str, stdin: str, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, script, "--headless"], input=stdin,
+                                   capture_output=True, text=True)
+        timings.append(time.perf_counter() - start)
+        if completed.returncode != 0 or completed.stderr:
+            raise Exception(f"{script} failed: {completed.stderr.strip()}")
+    return statistics.median(timings)
+
+
+def run(repeats: int = 10, limit: float = 0.1):
+    failed = False
+    for script, stdin in _runs:
+        timing = measure(script, stdin, repeats)
+        print(f"{script}: {timing * 1000:.1f} ms (median of {repeats}, limit {limit * 1000:.0f} ms)")
+        if timing > limit:
+            failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,27 @@
+from functions_system import *
+from root_methods_system import SimpleIterationSystemMethod
+
+
+def _contains(box: list[Interval], point: list[float]) -> bool:
+    return all(x.lo <= value <= x.hi for x, value in zip(box, point))
+
+
+def test_built_in_systems_are_certified():
+    method = SimpleIterationSystemMethod()
+    for system, intervals, start in [(get_all_equation_systems()[0], [[0, 1], [0, 1]], [0.2, 0.6]),
+                                     (get_all_equation_systems()[1], [[1, 2], [-2, 0]], [1.5, -1])]:
+        box = system.certify_unique_root(intervals)
+        assert box is not None
+        assert method.is_certified_box(system, intervals)
+        answer = method.extract_answer(method.evaluate_root(system, intervals, start, 1e-10))
+        assert _contains(box, answer)
+
+
+def test_box_without_root_is_not_certified():
+    system = get_all_equation_systems()[1]
+    assert system.certify_unique_root([[1, 2], [-3, -1]]) is None
+
+
+def test_uniqueness_is_proven_by_excluding_the_rest():
+    box = get_all_equation_systems()[0].certify_unique_root([[-3, 3], [-3, 3]], max_depth=14)
+    assert box is not None and _contains(box, [0.2039, 0.6778])
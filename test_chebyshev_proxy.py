@@ -0,0 +1,22 @@
+import math
+
+from functions import Function, ChebyshevProxy, get_all_functions
+from root_methods import PolynomialRootsMethod
+
+
+def test_double_root_reported_once():
+    proxy = ChebyshevProxy(Function("(x - 0.3)^2", lambda x: (x - 0.3) ** 2), -1, 1)
+    roots = proxy.roots_on_interval(-1, 1)
+    assert len(roots) == 1 and abs(roots[0] - 0.3) < 1e-7
+    assert len(PolynomialRootsMethod().evaluate_root(proxy, -1, 1)) == 1
+
+
+def test_roots_are_polished_once():
+    proxy = ChebyshevProxy(get_all_functions()[1], 0, 3)
+    roots = proxy.roots_on_interval(0, 3)
+    evaluations = proxy.evaluations
+    for _ in range(10):
+        assert proxy.has_one_root_on_interval(1, 1.5)
+    PolynomialRootsMethod().evaluate_root(proxy, 1, 1.5)
+    assert proxy.evaluations == evaluations
+    assert all(abs(root - math.sqrt(math.pi / 2 + math.pi * k)) < 1e-12 for k, root in enumerate(roots))
@@ -0,0 +1,48 @@
+import math
+import random
+
+from interval_arithmetic import Interval, sin, cos
+
+
+def _random_intervals(count: int, seed: int = 0):
+    generator = random.Random(seed)
+    for _ in range(count):
+        center = generator.uniform(-20, 20)
+        width = 10 ** generator.uniform(-15, 1)
+        yield center - width / 2, center + width / 2, generator
+
+
+def _assert_encloses(interval: Interval, value: float):
+    assert interval.lo <= value <= interval.hi, f"{value} isn't in {interval}"
+
+
+def test_sin_cos_enclose_point_values():
+    for lo, hi, generator in _random_intervals(50000):
+        box = Interval(lo, hi)
+        for x in (lo, hi, lo + (hi - lo) * generator.random()):
+            _assert_encloses(sin(box), math.sin(x))
+            _assert_encloses(cos(box), math.cos(x))
+
+
+def test_cos_reported_case():
+    lo, hi = -1.344658641898933, -1.344658641896827
+    _assert_encloses(cos(Interval(lo, hi)), math.cos(hi))
+    _assert_encloses(cos(Interval(lo, hi)), math.cos(lo))
+
+
+def test_sin_cos_extrema():
+    assert cos(Interval(-0.1, 0.1)).hi == 1
+    assert cos(Interval(3, 3.2)).lo == -1
+    assert sin(Interval(1.5, 1.6)).hi == 1
+    assert sin(Interval(-1.6, -1.5)).lo == -1
+    assert sin(Interval(0, 7)).lo == -1 and sin(Interval(0, 7)).hi == 1
+
+
+def test_pow_encloses_point_values():
+    for lo, hi, generator in _random_intervals(20000, seed=1):
+        box = Interval(lo, hi)
+        for power in range(0, 6):
+            result = box ** power
+            for x in (lo, hi, lo + (hi - lo) * generator.random()):
+                _assert_encloses(result, x ** power)
+    assert (Interval(-2, 1) ** 2).lo == 0
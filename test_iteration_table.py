@@ -0,0 +1,36 @@
+import numpy as np
+
+from iteration_table import IterationTable
+
+
+def test_growth_keeps_rows():
+    table = IterationTable(["a", "b"], capacity=1)
+    for i in range(100):
+        table.append([i, -i])
+    assert len(table) == 100
+    assert table.rows().tolist() == [[i, -i] for i in range(100)]
+    assert list(table.last()) == [99, -99]
+
+
+def test_ring_buffer_keeps_last_rows():
+    table = IterationTable(["a", "b"], history_size=3)
+    for i in range(2):
+        table.append([i, -i])
+    assert table.rows().tolist() == [[0, 0], [1, -1]]
+    for i in range(2, 8):
+        table.append([i, -i])
+    frame = table.to_frame()
+    assert len(table) == 8
+    assert frame.index.tolist() == [5, 6, 7]
+    assert frame["a"].tolist() == [5, 6, 7] and frame["b"].tolist() == [-5, -6, -7]
+    assert list(table.last()) == [7, -7]
+
+
+def test_to_frame_is_zero_copy():
+    table = IterationTable(["a", "b"])
+    for i in range(10):
+        table.append([i, 2 * i])
+    frame = table.to_frame()
+    buffer = np.frombuffer(table._data)
+    assert np.shares_memory(frame["a"].to_numpy(), buffer)
+    assert np.shares_memory(frame["b"].to_numpy(), buffer)
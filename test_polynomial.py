@@ -0,0 +1,36 @@
+import numpy as np
+
+from functions import Polynomial
+from root_methods import PolynomialRootsMethod
+
+
+def test_leading_zero_coefficients_are_stripped():
+    polynomial = Polynomial("x - 1", [0.0, 1.0, -1.0])
+    assert polynomial.coefficients == [1.0, -1.0]
+    assert polynomial.count_roots_on_interval(0, 2) == 1
+    assert polynomial.has_one_root_on_interval(0, 2)
+
+
+def test_root_at_left_boundary():
+    polynomial = Polynomial("x - 1", [1.0, -1.0])
+    assert polynomial.count_roots_on_interval(1, 2) == 1
+    assert polynomial.has_one_root_on_interval(1, 2)
+
+
+def test_double_root_reported_once():
+    polynomial = Polynomial("(x - 1)^2 (x + 2)", np.poly([1, 1, -2]))
+    roots = polynomial.roots_on_interval(0, 3)
+    assert len(roots) == 1 and abs(roots[0] - 1) < 1e-7
+    assert len(PolynomialRootsMethod().evaluate_root(polynomial, 0, 3)) == 1
+
+
+def test_close_distinct_roots_are_kept():
+    for expected, left, right in [([0.5, 0.5000005], 0, 1), ([1, 1.000001], 0, 2)]:
+        polynomial = Polynomial("", np.poly(expected + [3]))
+        roots = polynomial.roots_on_interval(left, right)
+        assert len(roots) == 2
+        assert all(abs(root - value) < 1e-8 for root, value in zip(roots, expected))
+
+
+def test_zero_polynomial_has_no_unique_root():
+    assert not Polynomial("0", [0.0]).has_one_root_on_interval(0, 1)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from functions_system import *
+from root_methods_system import NewtonSystemMethod
+
+pytest.importorskip("scipy")
+
+
+def _get_tridiagonal_system(n: int) -> EquationSystem:
+    h = 1 / (n + 1)
+
+    def make(i: int) -> ManyArgumentFunction:
+        return ManyArgumentFunction(
+            f"x_{i} = (x_{i - 1} + x_{i + 1} + h^2 (1 - x_{i}^3)) / 2",
+            n,
+            lambda args: ((args[i - 1] if i > 0 else 0) + (args[i + 1] if i < n - 1 else 0)
+                          + h * h * (1 - args[i] ** 3)) / 2,
+            [j for j in (i - 1, i, i + 1) if 0 <= j < n]
+        )
+
+    return EquationSystem("", [make(i) for i in range(n)])
+
+
+def _dense_jacobian(system: EquationSystem, point: list[float]) -> np.ndarray:
+    n = len(point)
+    return np.array([[system.funcs[i].partial_derivative_at(point, j) - (1 if i == j else 0) for j in range(n)]
+                     for i in range(n)])
+
+
+def test_column_groups_are_independent():
+    system = _get_tridiagonal_system(50)
+    groups = system.column_groups()
+    assert len(groups) == 3
+    assert sorted(col for group in groups for col in group) == list(range(50))
+    for group in groups:
+        rows = [row for col in group for row in range(50) if col in system.funcs[row].dependencies or row == col]
+        assert len(rows) == len(set(rows))
+
+
+def test_sparse_jacobian_matches_dense():
+    for system, point in [(_get_tridiagonal_system(30), [0.1 * (i % 7) for i in range(30)]),
+                          (get_all_equation_systems()[0], [0.2, 0.6]),
+                          (get_all_equation_systems()[1], [1.5, -1.0])]:
+        sparse = system.jacobian_at(point)
+        assert np.allclose(sparse.toarray(), _dense_jacobian(system, point), atol=1e-6)
+        assert sparse.nnz <= sum(len(func.dependencies) + 1 for func in system.funcs)
+
+
+def test_large_newton_solve():
+    n = 2000
+    system = _get_tridiagonal_system(n)
+    method = NewtonSystemMethod()
+    result = method.evaluate_root(system, [[-1, 1]] * n, [0.0] * n, 1e-10, history_size=3)
+    answer = method.extract_answer(result)
+    assert len(result) < 10
+    assert max(abs(func.at(answer) - answer[i]) for i, func in enumerate(system.funcs)) < 1e-10
@@ -0,0 +1,52 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from iteration_table import IterationTable
+from trace_store import TraceReader, TraceWriter
+
+
+def _write_traces(path: str, writer_id: int, count: int):
+    with TraceWriter(path) as writer:
+        for i in range(count):
+            table = IterationTable(["writer", "row"])
+            for row in range(1 + (writer_id + i) % 4):
+                table.append([writer_id, row])
+            writer.write(table, f"writer {writer_id % 2}", [writer_id, i])
+
+
+def test_concurrent_writers(tmp_path):
+    path = str(tmp_path / "traces")
+    processes = [multiprocessing.Process(target=_write_traces, args=(path, writer_id, 50)) for writer_id in range(8)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    reader = TraceReader(path)
+    assert len(reader) == 400
+    assert sorted(reader.jobs().tolist()) == list(range(400))
+    records = np.sort(reader.index, order="offset")
+    expected = records["offset"][0]
+    for record in records:
+        assert record["offset"] == expected
+        expected += record["rows"] * record["columns"] + record["answer_size"]
+    for job in reader.jobs():
+        writer_id, i = reader.answer(job)
+        trace = reader.trace(job)
+        assert len(trace) == 1 + (int(writer_id) + int(i)) % 4
+        assert np.all(trace[:, 0] == writer_id)
+        assert trace[:, 1].tolist() == list(range(len(trace)))
+        assert reader.method(job) == f"writer {int(writer_id) % 2}"
+
+
+def test_duplicate_job_is_rejected(tmp_path):
+    table = IterationTable(["x"])
+    table.append([1.0])
+    with TraceWriter(str(tmp_path)) as writer:
+        assert writer.write(table, "method", 1.0, job=5) == 5
+        with pytest.raises(Exception):
+            writer.write(table, "method", 1.0, job=5)
+        assert writer.write(table, "method", 1.0) == 6
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+from typing import TYPE_CHECKING
+
+from iteration_table import IterationTable
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# one record per solve: job id, offset in traces (in floats), stored rows, columns, answer size, schema, iterations
+_index_fields = ["job", "offset", "rows", "columns", "answer_size", "schema", "iterations"]
+_index_record = struct.Struct("<" + "q" * len(_index_fields))
+_index_file = "index.bin"
+_traces_file = "traces.bin"
+_schemas_file = "schemas.json"
+
+
+def _read_schemas(path: str) -> list[dict]:
+    filename = os.path.join(path, _schemas_file)
+    if not os.path.exists(filename):
+        return []
+    with open(filename) as file:
+        return json.load(file)
+
+
+def _file_size(path: str, filename: str) -> int:
+    filename = os.path.join(path, filename)
+    return os.path.getsize(filename) if os.path.exists(filename) else 0
+
+
+def _lock(file):
+    if os.name == "nt":
+        import msvcrt
+
+        file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue    # LK_LOCK gives up after 10 seconds, the other writer is still busy
+    else:
+        import fcntl
+
+        fcntl.flock(file, fcntl.LOCK_EX)
+
+
+def _unlock(file):
+    if os.name == "nt":
+        import msvcrt
+
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(file, fcntl.LOCK_UN)
+
+
+class TraceWriter:
+    path: str = ""
+
+    def __init__(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self._schemas: list[dict] = []
+        self._jobs: set[int] = set()
+        self._next_job = 0
+        self._synced = 0    # bytes of the index already read into _jobs
+        self._index = open(os.path.join(path, _index_file), "a+b")
+        self._traces = open(os.path.join(path, _traces_file), "ab")
+
+    def write(self, result: IterationTable, method, answer, job: int = None) -> int:
+        answer = list(answer) if isinstance(answer, (list, tuple)) else [answer]
+        rows = result.rows()
+        # other writers may append to the same store, so everything is derived from the files under the lock
+        _lock(self._index)
+        try:
+            self._sync()
+            if job is None:
+                job = self._next_job
+            elif job in self._jobs:
+                raise Exception(f"Trace for job {job} already exists")
+            schema = self._get_schema(str(method), result.columns)
+            offset = os.fstat(self._traces.fileno()).st_size // 8
+            # column after column, so each column of a trace is contiguous on disk
+            self._traces.write(rows.T.tobytes())
+            self._traces.write(struct.pack(f"<{len(answer)}d", *answer))
+            self._traces.flush()
+            self._index.write(_index_record.pack(job, offset, len(rows), len(result.columns),
+                                                 len(answer), schema, len(result)))
+            self._index.flush()
+            self._sync()
+        finally:
+            _unlock(self._index)
+        return job
+
+    def _sync(self):
+        self._index.seek(self._synced)
+        data = self._index.read()
+        records = len(data) // _index_record.size
+        for i in range(records):
+            job = _index_record.unpack_from(data, i * _index_record.size)[0]
+            self._jobs.add(job)
+            self._next_job = max(self._next_job, job + 1)
+        self._synced += records * _index_record.size
+        self._schemas = _read_schemas(self.path)
+
+    def close(self):
+        self._traces.close()
+        self._index.close()
+
+    def _get_schema(self, method: str, columns: list[str]) -> int:
+        schema = {"method": method, "columns": list(columns)}
+        if schema not in self._schemas:
+            self._schemas.append(schema)
+            filename = os.path.join(self.path, _schemas_file)
+            temporary = f"{filename}.{os.getpid()}.tmp"
+            with open(temporary, "w") as file:
+                json.dump(self._schemas, file)
+            os.replace(temporary, filename)
+        return self._schemas.index(schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class TraceReader:
+    path: str = ""
+
+    def __init__(self, path: str):
+        import numpy as np
+
+        assert os.path.isdir(path), "Not a trace directory"
+        self.path = path
+        self._schemas = _read_schemas(path)
+        dtype = np.dtype([(field, "<i8") for field in _index_fields])
+        index_filename = os.path.join(path, _index_file)
+        self.index = np.fromfile(index_filename, dtype=dtype) if os.path.exists(index_filename) \
+            else np.empty(0, dtype=dtype)
+        self._traces = np.memmap(os.path.join(path, _traces_file), dtype="<f8", mode="r") \
+            if _file_size(path, _traces_file) > 0 else np.empty(0)
+        self._positions = None
+
+    def jobs(self) -> np.ndarray:
+        return self.index["job"]
+
+    def trace(self, job: int) -> np.ndarray:
+        record = self._record(job)
+        size = record["rows"] * record["columns"]
+        columns = self._traces[record["offset"]:record["offset"] + size]
+        return columns.reshape(record["columns"], record["rows"]).T
+
+    def answer(self, job: int) -> np.ndarray:
+        record = self._record(job)
+        start = record["offset"] + record["rows"] * record["columns"]
+        return self._traces[start:start + record["answer_size"]]
+
+    def method(self, job: int) -> str:
+        return self._schemas[self._record(job)["schema"]]["method"]
+
+    def to_frame(self, job: int) -> pd.DataFrame:
+        import pandas as pd
+
+        record = self._record(job)
+        first = record["iterations"] - record["rows"]
+        return pd.DataFrame(data=self.trace(job), columns=self._schemas[record["schema"]]["columns"],
+                            index=pd.RangeIndex(first, record["iterations"]), copy=False)
+
+    def _record(self, job: int):
+        if self._positions is None:
+            self._positions = {int(j): i for i, j in enumerate(self.index["job"])}
+        if job not in self._positions:
+            raise Exception(f"No trace for job {job}")
+        return self.index[self._positions[job]]
+
+    def __len__(self):
+        return len(self.index)